@@ -6,6 +6,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from ase.io import Trajectory as AseTrajectory
@@ -56,11 +57,15 @@ class AseMaker(Maker, ABC):
     class EMTStaticMaker(AseMaker):
         name: str = "EMT static maker"
 
-        @property
+        @cached_property
         def calculator(self):
             return EMT()
     ```
 
+    Defining `calculator` as a `cached_property` ensures that potentially
+    expensive calculator setup happens only once per maker instance, even
+    when the calculator is accessed multiple times during a job.
+
     Note that the user should adapt `run_ase`, which is not a job
     and makes a call to ASE, and `make`, which is a job, to their uses.
 
@@ -114,8 +119,9 @@ class AseMaker(Maker, ABC):
             A previous calculation directory to copy output files from. Unused, just
                 added to match the method signature of other makers.
         """
+        calc = self.calculator
         return AseTaskDoc.to_mol_or_struct_metadata_doc(
-            getattr(self.calculator, "name", type(self.calculator).__name__),
+            getattr(calc, "name", type(calc).__name__),
             self.run_ase(mol_or_struct, prev_dir=prev_dir),
         )
 
@@ -136,15 +142,16 @@ class AseMaker(Maker, ABC):
                 added to match the method signature of other makers.
         """
         is_mol = isinstance(mol_or_struct, Molecule)
-        adaptor = AseAtomsAdaptor()
-        atoms = adaptor.get_atoms(mol_or_struct)
+        atoms = mol_or_struct.to_ase_atoms()
         atoms.calc = self.calculator
         t_i = time.perf_counter()
         final_energy = atoms.get_potential_energy()
         t_f = time.perf_counter()
         return AseResult(
-            final_mol_or_struct=getattr(
-                adaptor, f"get_{'molecule' if is_mol else 'structure'}"
+            final_mol_or_struct=(
+                AseAtomsAdaptor.get_molecule
+                if is_mol
+                else AseAtomsAdaptor.get_structure
             )(atoms),
             final_energy=final_energy,
             elapsed_time=t_f - t_i,
@@ -225,8 +232,9 @@ class AseRelaxMaker(AseMaker):
         -------
         AseStructureTaskDoc or AseMoleculeTaskDoc
         """
+        calc = self.calculator
         return AseTaskDoc.to_mol_or_struct_metadata_doc(
-            getattr(self.calculator, "name", type(self.calculator).__name__),
+            getattr(calc, "name", type(calc).__name__),
             self.run_ase(mol_or_struct, prev_dir=prev_dir),
             self.steps,
             relax_kwargs=self.relax_kwargs,
@@ -284,7 +292,7 @@ class EmtRelaxMaker(AseRelaxMaker):
 
     name: str = "EMT relaxation"
 
-    @property
+    @cached_property
     def calculator(self) -> Calculator:
         """EMT calculator."""
         from ase.calculators.emt import EMT
@@ -305,7 +313,7 @@ class LennardJonesRelaxMaker(AseRelaxMaker):
 
     name: str = "Lennard-Jones 6-12 relaxation"
 
-    @property
+    @cached_property
     def calculator(self) -> Calculator:
         """Lennard-Jones calculator."""
         from ase.calculators.lj import LennardJones
@@ -363,7 +371,7 @@ class GFNxTBRelaxMaker(AseRelaxMaker):
         }
     )
 
-    @property
+    @cached_property
     def calculator(self) -> Calculator:
         """GFN-xTB / TBLite calculator."""
         try:
@@ -3,36 +3,28 @@
 from __future__ import annotations
 
 import contextlib
-import io
 import logging
 import os
 import sys
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import cached_property, lru_cache
 from importlib import import_module
 from typing import TYPE_CHECKING
 
 import numpy as np
 from ase import units
-from ase.md.md import MolecularDynamics
-from ase.md.npt import NPT
-from ase.md.velocitydistribution import (
-    MaxwellBoltzmannDistribution,
-    Stationary,
-    ZeroRotation,
-)
 
 try:
     from emmet.core.types.enums import StoreTrajectoryOption
 except ImportError:
     from emmet.core.vasp.calculation import StoreTrajectoryOption
-from jobflow import job
+from jobflow import Flow, Response, job
 from pymatgen.core.structure import Molecule, Structure
 from pymatgen.io.ase import AseAtomsAdaptor
-from scipy.interpolate import interp1d
 
 from atomate2.ase.jobs import _ASE_DATA_OBJECTS, AseMaker
 from atomate2.ase.schemas import AseResult, AseTaskDoc
@@ -43,11 +35,16 @@ if TYPE_CHECKING:
     from typing import Literal
 
     from ase.calculators.calculator import Calculator
+    from ase.md.md import MolecularDynamics
 
     from atomate2.ase.schemas import AseMoleculeTaskDoc, AseStructureTaskDoc
 
 logger = logging.getLogger(__name__)
 
+# conversion from the maker's kilobar pressure unit to ASE-native pressure,
+# hoisted so per-step code paths don't re-derive it
+_KBAR_TO_ASE_PRESSURE = 1e3 * units.bar
+
 
 class MDEnsemble(Enum):
     """Define known MD ensembles."""
@@ -76,6 +73,17 @@ default_dynamics = {
     MDEnsemble.npt: "nose-hoover-chain",
 }
 
+
+@lru_cache(maxsize=128)
+def _contains_h_isotope(species: tuple) -> bool:
+    """Check a deduplicated species tuple for hydrogen isotopes.
+
+    Cached so sweep workflows that fan out many MD jobs over the same
+    composition only pay for the scan once per process.
+    """
+    return any(sp.Z == 1 for sp in species)
+
+
 _valid_dynamics: dict[MDEnsemble, set[str]] = {}
 for preset in DynamicsPresets.__members__:
     ensemble = MDEnsemble(preset.split("_")[0])
@@ -159,6 +167,13 @@ class AseMDMaker(AseMaker, ABC):
     mb_velocity_seed : int or None
         If an int, a random number seed for generating initial velocities
         from a Maxwell-Boltzmann distribution.
+    n_replicas : int = 1
+        The number of independent MD replicas to run. If greater than one,
+        `make` replaces itself with a flow of `n_replicas` sibling MD jobs
+        that differ only in their velocity seeds, and the job output becomes
+        the list of replica task documents.
+    replica_seed_offset : int = 0
+        Offset added to `mb_velocity_seed` when generating per-replica seeds.
     zero_linear_momentum : bool = False
         Whether to initialize the atomic velocities with zero linear momentum
     zero_angular_momentum : bool = False
@@ -179,9 +194,11 @@ class AseMDMaker(AseMaker, ABC):
     ionic_step_data: tuple[str, ...] | None = None
     store_trajectory: StoreTrajectoryOption = StoreTrajectoryOption.PARTIAL
     traj_file: str | Path | None = None
-    traj_file_fmt: Literal["pmg", "ase", "xdatcar"] = "ase"
+    traj_file_fmt: Literal["pmg", "ase", "xdatcar", "parquet"] = "ase"
     traj_interval: int = 1
     mb_velocity_seed: int | None = None
+    n_replicas: int = 1
+    replica_seed_offset: int = 0
     zero_linear_momentum: bool = False
     zero_angular_momentum: bool = False
     verbose: bool = False
@@ -201,13 +218,20 @@ class AseMDMaker(AseMaker, ABC):
             values,
         )
 
+    @staticmethod
+    def _constant_schedule(value: float, n_pts: int) -> np.ndarray:
+        """Build a constant schedule as a zero-copy broadcast view.
+
+        Avoids materializing an O(n_steps) array just to index the same
+        scalar on every step.
+        """
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), (n_pts,))
+
     def _get_ensemble_schedule(self) -> None:
         if self.ensemble == MDEnsemble.nve:
             # Disable thermostat and barostat
-            self.temperature = np.nan
-            self.pressure = np.nan
-            self.t_schedule = np.full(self.n_steps + 1, self.temperature)
-            self.p_schedule = np.full(self.n_steps + 1, self.pressure)
+            self.t_schedule = self._constant_schedule(np.nan, self.n_steps + 1)
+            self.p_schedule = self._constant_schedule(np.nan, self.n_steps + 1)
             return
 
         if isinstance(self.temperature, Sequence) or (
@@ -218,11 +242,12 @@ class AseMDMaker(AseMaker, ABC):
         # scalars, but in principle one quantity per atom could be specified by giving
         # an array. This is not implemented yet here.
         else:
-            self.t_schedule = np.full(self.n_steps + 1, self.temperature)
+            self.t_schedule = self._constant_schedule(
+                self.temperature, self.n_steps + 1
+            )
 
         if self.ensemble == MDEnsemble.nvt:
-            self.pressure = np.nan
-            self.p_schedule = np.full(self.n_steps + 1, self.pressure)
+            self.p_schedule = self._constant_schedule(np.nan, self.n_steps + 1)
             return
 
         if isinstance(self.pressure, Sequence) or (
@@ -230,44 +255,52 @@ class AseMDMaker(AseMaker, ABC):
         ):
             self.p_schedule = self._interpolate_quantity(self.pressure, self.n_steps)
         elif isinstance(self.pressure, np.ndarray) and self.pressure.ndim == 4:
-            self.p_schedule = interp1d(
-                np.arange(self.n_steps + 1), self.pressure, kind="linear"
-            )
+            # Tensor-valued schedule sampled on the step grid along the last
+            # axis: evaluating a linear interpolant at integer steps is the
+            # identity, so just reorder the axes to make the schedule
+            # step-indexable without constructing an interpolator object.
+            self.p_schedule = np.moveaxis(self.pressure, -1, 0)
         else:
-            self.p_schedule = np.full(self.n_steps + 1, self.pressure)
+            self.p_schedule = self._constant_schedule(self.pressure, self.n_steps + 1)
+
+    def _get_ensemble_defaults(self) -> dict:
+        """Resolve ASE MD kwargs with defaults consistent with VASP MD.
+
+        Returns a working copy; the maker's own fields are left untouched so
+        a single maker instance can be reused across jobs without leaking
+        resolved defaults between runs.
+        """
+        from ase.md.md import MolecularDynamics
 
-    def _get_ensemble_defaults(self) -> None:
-        """Update ASE MD kwargs with defaults consistent with VASP MD."""
-        self.ase_md_kwargs = self.ase_md_kwargs or {}
-        self.dynamics = self.dynamics or default_dynamics[self.ensemble]
+        ase_md_kwargs = dict(self.ase_md_kwargs or {})
+        dynamics = self.dynamics or default_dynamics[self.ensemble]
 
         if self.ensemble == MDEnsemble.nve:
-            self.ase_md_kwargs.pop("temperature", None)
-            self.ase_md_kwargs.pop("temperature_K", None)
-            self.ase_md_kwargs.pop("externalstress", None)
+            ase_md_kwargs.pop("temperature", None)
+            ase_md_kwargs.pop("temperature_K", None)
+            ase_md_kwargs.pop("externalstress", None)
         elif self.ensemble == MDEnsemble.nvt:
-            self.ase_md_kwargs["temperature_K"] = self.ase_md_kwargs.get(
+            ase_md_kwargs["temperature_K"] = ase_md_kwargs.get(
                 "temperature_K", self.t_schedule[0]
             )
-            self.ase_md_kwargs.pop("externalstress", None)
+            ase_md_kwargs.pop("externalstress", None)
         elif self.ensemble == MDEnsemble.npt:
-            self.ase_md_kwargs["temperature_K"] = self.ase_md_kwargs.get(
+            ase_md_kwargs["temperature_K"] = ase_md_kwargs.get(
                 "temperature_K", self.t_schedule[0]
             )
 
             # These use different kwargs for pressure
             if (
                 (
-                    isinstance(self.dynamics, DynamicsPresets)
-                    and DynamicsPresets(self.dynamics)
-                    == DynamicsPresets.npt_nose_hoover
+                    isinstance(dynamics, DynamicsPresets)
+                    and DynamicsPresets(dynamics) == DynamicsPresets.npt_nose_hoover
                 )
                 or (
-                    isinstance(self.dynamics, type)
-                    and issubclass(self.dynamics, MolecularDynamics)
-                    and self.dynamics.__name__ == "NPT"
+                    isinstance(dynamics, type)
+                    and issubclass(dynamics, MolecularDynamics)
+                    and dynamics.__name__ == "NPT"
                 )
-                or (isinstance(self.dynamics, str) and self.dynamics == "nose-hoover")
+                or (isinstance(dynamics, str) and dynamics == "nose-hoover")
             ):
                 logger.warning(
                     "The `NPT` module in ASE is no longer recommended."
@@ -277,16 +310,18 @@ class AseMDMaker(AseMaker, ABC):
             else:
                 stress_kwarg = "pressure_au"
 
-            self.ase_md_kwargs[stress_kwarg] = self.ase_md_kwargs.get(
-                stress_kwarg, self.p_schedule[0] * 1e3 * units.bar
+            ase_md_kwargs[stress_kwarg] = ase_md_kwargs.get(
+                stress_kwarg, self.p_schedule[0] * _KBAR_TO_ASE_PRESSURE
             )
 
-        if isinstance(self.dynamics, str) and self.dynamics.lower() == "langevin":
-            self.ase_md_kwargs["friction"] = self.ase_md_kwargs.get(
+        if isinstance(dynamics, str) and dynamics.lower() == "langevin":
+            ase_md_kwargs["friction"] = ase_md_kwargs.get(
                 "friction",
                 10.0 * 1e-3 / units.fs,  # Same default as in VASP: 10 ps^-1
             )
 
+        return ase_md_kwargs
+
     @job(data=[*_ASE_DATA_OBJECTS, "ionic_steps"])
     def make(
         self,
@@ -304,8 +339,30 @@ class AseMDMaker(AseMaker, ABC):
             A previous calculation directory to copy output files from. Unused, just
             added to match the method signature of other makers.
         """
+        if self.n_replicas > 1:
+            # Independent replicas are embarrassingly parallel: replace this
+            # job with a flow of sibling single-replica MD jobs so a parallel
+            # jobflow runner can schedule them concurrently.
+            seed = self.mb_velocity_seed
+            replica_jobs = []
+            for idx in range(self.n_replicas):
+                replica_maker = replace(
+                    self,
+                    n_replicas=1,
+                    name=f"{self.name} replica {idx + 1}",
+                    mb_velocity_seed=(
+                        None if seed is None else seed + self.replica_seed_offset + idx
+                    ),
+                )
+                replica_jobs.append(
+                    replica_maker.make(mol_or_struct, prev_dir=prev_dir)
+                )
+            flow = Flow(replica_jobs, output=[rep.output for rep in replica_jobs])
+            return Response(replace=flow)
+
+        calc = self.calculator
         return AseTaskDoc.to_mol_or_struct_metadata_doc(
-            getattr(self.calculator, "name", type(self.calculator).__name__),
+            getattr(calc, "name", type(calc).__name__),
             self.run_ase(mol_or_struct, prev_dir=prev_dir),
             steps=self.n_steps,
             relax_kwargs=None,
@@ -336,38 +393,53 @@ class AseMDMaker(AseMaker, ABC):
             A previous calculation directory to copy output files from. Unused, just
             added to match the method signature of other makers.
         """
+        # Defer the ASE MD imports to runtime so merely importing this module
+        # (e.g. to construct a maker) does not pull in the dynamics machinery.
+        from ase.md.md import MolecularDynamics
+        from ase.md.npt import NPT
+        from ase.md.velocitydistribution import (
+            MaxwellBoltzmannDistribution,
+            Stationary,
+            ZeroRotation,
+        )
+
         self._get_ensemble_schedule()
-        self._get_ensemble_defaults()
+        ase_md_kwargs = self._get_ensemble_defaults()
 
-        if self.time_step is None:
+        time_step = self.time_step
+        if time_step is None:
             # If a mol_or_struct contains an isotope of hydrogen,
             # set default `time_step` to 0.5 fs, and 2 fs otherwise.
-            has_h_isotope = any(element.Z == 1 for element in mol_or_struct.composition)
-            self.time_step = 0.5 if has_h_isotope else 2.0
+            # `types_of_species` is deduplicated and avoids accumulating a
+            # full Composition over all sites just for this containment check
+            has_h_isotope = _contains_h_isotope(mol_or_struct.types_of_species)
+            time_step = 0.5 if has_h_isotope else 2.0
 
         initial_velocities = mol_or_struct.site_properties.get("velocities")
 
-        if isinstance(self.dynamics, str):
-            # Use known dynamics if `self.dynamics` is a str
-            self.dynamics = self.dynamics.lower()
-            if self.dynamics not in _valid_dynamics[self.ensemble]:
+        dynamics = self.dynamics or default_dynamics[self.ensemble]
+        if isinstance(dynamics, str):
+            # Use known dynamics if `dynamics` is a str
+            dynamics = dynamics.lower()
+            if dynamics not in _valid_dynamics[self.ensemble]:
                 raise ValueError(
-                    f"{self.dynamics} thermostat not available for "
+                    f"{dynamics} thermostat not available for "
                     f"{self.ensemble.value}. "
                     f"Available {self.ensemble.value} thermostats are: "
                     " ".join(_valid_dynamics[self.ensemble])
                 )
 
             _dyn_mod_path = DynamicsPresets[
-                f"{self.ensemble.value}_{self.dynamics.replace('-', '_')}"
+                f"{self.ensemble.value}_{dynamics.replace('-', '_')}"
             ].value.split(".")
             dynamics = getattr(
                 import_module(".".join(_dyn_mod_path[:-1])), _dyn_mod_path[-1]
             )
 
-        elif issubclass(self.dynamics, MolecularDynamics):
-            # Allow user to explicitly run ASE Dynamics class
-            dynamics = self.dynamics
+        elif not issubclass(dynamics, MolecularDynamics):
+            raise TypeError(
+                "dynamics must be a preset name or an ASE MolecularDynamics subclass"
+            )
 
         atoms = mol_or_struct.to_ase_atoms()
 
@@ -375,8 +447,11 @@ class AseMDMaker(AseMaker, ABC):
             # Note that until dynamics is instantiated,
             # `isinstance(dynamics,NPT)` is False
 
-            # ASE NPT implementation requires upper triangular cell
-            atoms.set_cell(atoms.cell.standard_form(form="upper")[0])
+            # ASE NPT implementation requires an exactly upper triangular
+            # cell; skip the rotation entirely if the cell already is one
+            cell = atoms.get_cell()
+            if np.any(np.asarray(cell)[np.tril_indices(3, k=-1)]):
+                atoms.set_cell(cell.standard_form(form="upper")[0])
 
         if initial_velocities:
             atoms.set_velocities(initial_velocities)
@@ -396,29 +471,67 @@ class AseMDMaker(AseMaker, ABC):
         md_observer = TrajectoryObserver(atoms, store_md_outputs=True)
 
         md_runner = dynamics(
-            atoms=atoms, timestep=self.time_step * units.fs, **self.ase_md_kwargs
+            atoms=atoms, timestep=time_step * units.fs, **ase_md_kwargs
         )
 
         md_runner.attach(md_observer, interval=self.traj_interval)
 
-        def _callback(dyn: MolecularDynamics = md_runner) -> None:
-            if self.ensemble == MDEnsemble.nve:
-                return
-            if hasattr(dyn, "_temperature_K"):
-                dyn._temperature_K = self.t_schedule[dyn.nsteps]  # noqa: SLF001
-            else:
-                dyn.set_temperature(temperature_K=self.t_schedule[dyn.nsteps])
-            if self.ensemble == MDEnsemble.nvt:
-                return
-
-            if "pressure_au" in self.ase_md_kwargs:
-                # set_pressure is broken for NPTBerendsen
-                dyn.pressure = self.p_schedule[dyn.nsteps] * 1e3 * units.bar
-            else:
-                dyn.set_stress(self.p_schedule[dyn.nsteps] * 1e3 * units.bar)
+        if self.ensemble != MDEnsemble.nve:
+            # Bind the schedules and per-run flags to locals so the per-step
+            # callback only does local lookups, instead of resolving `self.`
+            # attributes and re-checking the ensemble on every MD step.
+            t_schedule = self.t_schedule
+            p_schedule = self.p_schedule
+            is_nvt = self.ensemble == MDEnsemble.nvt
+            set_temp_directly = hasattr(md_runner, "_temperature_K")
+            use_pressure_attr = "pressure_au" in ase_md_kwargs
+
+            # The dynamics is constructed with temperature_K and the stress
+            # kwarg already set to the schedule's initial values; only update
+            # the integrator on steps where the schedule actually changes,
+            # and don't attach the callback at all for static schedules.
+            last_t = ase_md_kwargs.get("temperature_K")
+            stress_kwarg = "pressure_au" if use_pressure_attr else "externalstress"
+            last_p = ase_md_kwargs.get(stress_kwarg)
+            t_is_static = bool(np.all(t_schedule == last_t))
+            p_is_static = is_nvt or bool(
+                np.all(p_schedule * _KBAR_TO_ASE_PRESSURE == last_p)
+            )
 
-        md_runner.attach(_callback, interval=1)
-        with contextlib.redirect_stdout(sys.stdout if self.verbose else io.StringIO()):
+            # pre-scale the whole schedule to ASE units once so the per-step
+            # callback is a bare array lookup with no unit arithmetic
+            if not (is_nvt or p_is_static):
+                stress_schedule = p_schedule * _KBAR_TO_ASE_PRESSURE
+
+            def _callback(dyn: MolecularDynamics = md_runner) -> None:
+                nonlocal last_t, last_p
+                t_now = t_schedule[dyn.nsteps]
+                if t_now != last_t:
+                    if set_temp_directly:
+                        dyn._temperature_K = t_now  # noqa: SLF001
+                    else:
+                        dyn.set_temperature(temperature_K=t_now)
+                    last_t = t_now
+                if is_nvt or p_is_static:
+                    return
+
+                p_now = stress_schedule[dyn.nsteps]
+                if not np.array_equal(p_now, last_p):
+                    if use_pressure_attr:
+                        # set_pressure is broken for NPTBerendsen
+                        dyn.pressure = p_now
+                    else:
+                        dyn.set_stress(p_now)
+                    last_p = p_now
+
+            if not (t_is_static and p_is_static):
+                md_runner.attach(_callback, interval=1)
+        # Discard suppressed output at the OS level rather than accumulating
+        # the entire run's stdout in an in-memory StringIO buffer.
+        with (
+            open(os.devnull, "w") as devnull,
+            contextlib.redirect_stdout(sys.stdout if self.verbose else devnull),
+        ):
             t_i = time.perf_counter()
             md_runner.run(steps=self.n_steps)
             t_f = time.perf_counter()
@@ -455,7 +568,7 @@ class LennardJonesMDMaker(AseMDMaker):
 
     name: str = "Lennard-Jones 6-12 MD"
 
-    @property
+    @cached_property
     def calculator(self) -> Calculator:
         """Lennard-Jones calculator."""
         from ase.calculators.lj import LennardJones
@@ -489,7 +602,7 @@ class GFNxTBMDMaker(AseMDMaker):
         }
     )
 
-    @property
+    @cached_property
     def calculator(self) -> Calculator:
         """GFN-xTB / TBLite calculator."""
         try:
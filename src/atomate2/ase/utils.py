@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import contextlib
-import io
 import os
 import sys
 import time
@@ -67,8 +66,14 @@ class TrajectoryObserver:
     """Trajectory observer.
 
     This is a hook in the relaxation process that saves the intermediate structures.
+
+    Frames are stored structure-of-arrays style in preallocated NumPy buffers
+    (one per property) that grow geometrically, instead of one small array
+    per frame appended to a Python list.
     """
 
+    _initial_buffer_size = 64
+
     def __init__(self, atoms: Atoms, store_md_outputs: bool = False) -> None:
         """Initialize the Observer.
 
@@ -82,8 +87,6 @@ class TrajectoryObserver:
         """
         self.atoms = atoms
         self._is_periodic = any(atoms.pbc)
-        self.energies: list[float] = []
-        self.forces: list[np.ndarray] = []
 
         self._calc_kwargs = {
             "stresses": (
@@ -93,46 +96,103 @@ class TrajectoryObserver:
             "velocities": False,
             "temperature": False,
         }
-        self.stresses: list[np.ndarray] = []
-
-        self.magmoms: list[np.ndarray] = []
-
-        self.atom_positions: list[np.ndarray] = []
-        self.cells: list[np.ndarray] = []
 
         self._store_md_outputs = store_md_outputs
         if store_md_outputs:
             self._calc_kwargs |= dict(velocities=True, temperature=True)
-        # `self.{velocities,temperatures}` always initialized,
+        # buffers for `{velocities,temperatures}` are always available,
         # but data is only stored / saved to trajectory for MD runs
-        self.velocities: list[np.ndarray] = []
-        self.temperatures: list[float] = []
+        self._buffers: dict[str, np.ndarray] = {}
+        self._counts: dict[str, int] = {}
+
+    def _append(self, key: str, value: np.ndarray | float) -> None:
+        """Append one frame of `key`, growing its buffer as needed."""
+        value = np.asarray(value, dtype=np.float64)
+        count = self._counts.get(key, 0)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = np.empty((self._initial_buffer_size, *value.shape))
+            self._buffers[key] = buffer
+        elif count == len(buffer):
+            # double the capacity to amortize reallocation cost
+            buffer = np.concatenate([buffer, np.empty_like(buffer)])
+            self._buffers[key] = buffer
+        buffer[count] = value
+        self._counts[key] = count + 1
+
+    def _frames(self, key: str) -> np.ndarray:
+        """Return the filled frames of `key` as an array view."""
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return np.empty(0)
+        return buffer[: self._counts[key]]
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Potential energy of each stored frame."""
+        return self._frames("energies")
+
+    @property
+    def forces(self) -> np.ndarray:
+        """Interatomic forces of each stored frame."""
+        return self._frames("forces")
+
+    @property
+    def stresses(self) -> np.ndarray:
+        """Voigt stresses of each stored frame."""
+        return self._frames("stresses")
+
+    @property
+    def magmoms(self) -> np.ndarray:
+        """Magnetic moments of each stored frame."""
+        return self._frames("magmoms")
+
+    @property
+    def atom_positions(self) -> np.ndarray:
+        """Cartesian positions of each stored frame."""
+        return self._frames("atom_positions")
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Cell matrix of each stored frame."""
+        return self._frames("cells")
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Atomic velocities of each stored frame (MD runs only)."""
+        return self._frames("velocities")
+
+    @property
+    def temperatures(self) -> np.ndarray:
+        """Temperature of each stored frame (MD runs only)."""
+        return self._frames("temperatures")
 
     def __call__(self) -> None:
         """Save the properties of an Atoms during the relaxation."""
-        self.energies.append(self.compute_energy())
-        self.forces.append(self.atoms.get_forces())
+        atoms = self.atoms
+        self._append("energies", self.compute_energy())
+        self._append("forces", atoms.get_forces())
         # MD needs kinetic energy parts of stress, relaxations do not
         # When _store_md_outputs is True, ideal gas contribution to
         # stress is included.
         # Only store stress for periodic systems.
         if self._calc_kwargs["stresses"]:
-            self.stresses.append(
-                self.atoms.get_stress(include_ideal_gas=self._store_md_outputs)
+            self._append(
+                "stresses", atoms.get_stress(include_ideal_gas=self._store_md_outputs)
             )
 
         if self._calc_kwargs["magmoms"]:
             try:
-                self.magmoms.append(self.atoms.get_magnetic_moments())
+                self._append("magmoms", atoms.get_magnetic_moments())
             except PropertyNotImplementedError:
                 self._calc_kwargs["magmoms"] = False
 
-        self.atom_positions.append(self.atoms.get_positions())
-        self.cells.append(self.atoms.get_cell()[:])
+        self._append("atom_positions", atoms.get_positions())
+        self._append("cells", atoms.get_cell()[:])
 
         if self._store_md_outputs:
-            self.velocities.append(self.atoms.get_velocities())
-            self.temperatures.append(self.atoms.get_temperature())
+            self._append("velocities", atoms.get_velocities())
+            self._append("temperatures", atoms.get_temperature())
 
     def compute_energy(self) -> float:
         """
@@ -182,26 +242,26 @@ class TrajectoryObserver:
             Name of the file to write the ASE trajectory to.
             If None, no file is written.
         """
-        for idx in range(len(self.cells)):
-            atoms = self.atoms.copy()
-            atoms.set_positions(self.atom_positions[idx])
-            atoms.set_cell(self.cells[idx])
-
-            if self._store_md_outputs:
-                atoms.set_velocities(self.velocities[idx])
-
-            kwargs = {
-                "energy": self.energies[idx],
-                "forces": self.forces[idx],
-            }
-            if self._calc_kwargs["stresses"]:
-                kwargs["stress"] = self.stresses[idx]
-            if self._calc_kwargs["magmoms"]:
-                kwargs["magmom"] = self.magmoms[idx]
-
-            atoms.calc = SinglePointCalculator(atoms=atoms, **kwargs)
-            with AseTrajectory(filename, "a" if idx > 0 else "w", atoms=atoms) as file:
-                file.write()
+        with AseTrajectory(filename, "w") as file:
+            for idx in range(len(self.cells)):
+                atoms = self.atoms.copy()
+                atoms.set_positions(self.atom_positions[idx])
+                atoms.set_cell(self.cells[idx])
+
+                if self._store_md_outputs:
+                    atoms.set_velocities(self.velocities[idx])
+
+                kwargs = {
+                    "energy": self.energies[idx],
+                    "forces": self.forces[idx],
+                }
+                if self._calc_kwargs["stresses"]:
+                    kwargs["stress"] = self.stresses[idx]
+                if self._calc_kwargs["magmoms"]:
+                    kwargs["magmom"] = self.magmoms[idx]
+
+                atoms.calc = SinglePointCalculator(atoms=atoms, **kwargs)
+                file.write(atoms)
 
         return AseTrajectory(filename, "r")
 
@@ -384,7 +444,7 @@ class AseRelaxer:
         fmax: float = 0.1,
         steps: int = 500,
         traj_file: str = None,
-        traj_file_fmt: Literal["pmg", "ase", "xdatcar"] = "ase",
+        traj_file_fmt: Literal["pmg", "ase", "xdatcar", "parquet"] = "ase",
         final_atoms_object_file: str | os.PathLike[str] = "final_atoms_object.xyz",
         interval: int = 1,
         verbose: bool = False,
@@ -431,7 +491,10 @@ class AseRelaxer:
         if self.fix_symmetry:
             atoms.set_constraint(FixSymmetry(atoms, symprec=self.symprec))
         atoms.calc = self.calculator
-        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+        with (
+            open(os.devnull, "w") as devnull,
+            contextlib.redirect_stdout(sys.stdout if verbose else devnull),
+        ):
             obs = TrajectoryObserver(atoms)
             t_i = time.perf_counter()
             if steps > 1:
@@ -600,7 +663,10 @@ class AseNebInterface:
 
         neb_calc = NEB(images, **neb_kwargs)
 
-        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+        with (
+            open(os.devnull, "w") as devnull,
+            contextlib.redirect_stdout(sys.stdout if verbose else devnull),
+        ):
             observers = [TrajectoryObserver(image) for image in images]
             optimizer = self.opt_class(neb_calc, **(optimizer_kwargs or {}))
             for idx in range(num_images):
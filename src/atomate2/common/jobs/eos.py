@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -130,6 +132,15 @@ class EOSPostProcessor(MSONable, ABC):
         return self.results
 
 
+def _fit_eos_model(eos_name: str, volumes: np.ndarray, energies: np.ndarray) -> dict:
+    """Fit one EOS model; module-level so it can be sent to a process pool."""
+    try:
+        eos = EOS(eos_name=eos_name).fit(volumes, energies)
+    except EOSError as exc:
+        return {"exception": str(exc)}
+    return {**eos.results, "b0 GPa": float(eos.b0_GPa)}
+
+
 class PostProcessEosEnergy(EOSPostProcessor):
     """
     Fit energy vs. volume data to an EOS.
@@ -173,20 +184,35 @@ class PostProcessEosEnergy(EOSPostProcessor):
     )
 
     def eval(self) -> None:
-        """Fit the input data to each EOS in ``self.eos_models``."""
+        """Fit the input data to each EOS in ``self.eos_models``.
+
+        The fits are independent nonlinear least-squares problems, so they
+        are dispatched to a process pool rather than run sequentially.
+        """
+        fit_jobs = []
         for jobtype in self._use_job_types:
             self.results[jobtype]["EOS"] = {}
-            for eos_name in self.eos_models:
-                try:
-                    eos = EOS(eos_name=eos_name).fit(
-                        self.results[jobtype]["volume"], self.results[jobtype]["energy"]
-                    )
-                    self.results[jobtype]["EOS"][eos_name] = {
-                        **eos.results,
-                        "b0 GPa": float(eos.b0_GPa),
-                    }
-                except EOSError as exc:
-                    self.results[jobtype]["EOS"][eos_name] = {"exception": str(exc)}
+            volumes = np.asarray(self.results[jobtype]["volume"], dtype=np.float64)
+            energies = np.asarray(self.results[jobtype]["energy"], dtype=np.float64)
+            fit_jobs += [
+                (jobtype, eos_name, volumes, energies) for eos_name in self.eos_models
+            ]
+
+        if not fit_jobs:
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(len(fit_jobs), os.cpu_count() or 1)
+        ) as pool:
+            fits = pool.map(
+                _fit_eos_model,
+                [fit_job[1] for fit_job in fit_jobs],
+                [fit_job[2] for fit_job in fit_jobs],
+                [fit_job[3] for fit_job in fit_jobs],
+            )
+
+        for (jobtype, eos_name, *_), fit in zip(fit_jobs, fits, strict=True):
+            self.results[jobtype]["EOS"][eos_name] = fit
 
 
 class PostProcessEosPressure(EOSPostProcessor):
@@ -376,15 +402,7 @@ def apply_strain_to_structure(structure: Structure, deformations: list) -> list:
         A list of .TransformedStructure objects corresponding to the
         list of input deformations.
     """
-    transformations = []
-    for deformation in deformations:
-        # deform the structure
-        ts = TransformedStructure(
-            structure,
-            transformations=[DeformStructureTransformation(deformation=deformation)],
-        )
-        transformations += [ts]
-    return transformations
+    return _apply_strain_to_structure(structure, deformations)
 
 
 def _apply_strain_to_structure(structure: Structure, deformations: list) -> list:
@@ -458,21 +476,10 @@ class MPMorphEVPostProcess(PostProcessEosEnergy):
     )
 
     def eval(self) -> None:
-        """Fit the input data to the Birch-Murnaghan pressure EOS."""
-        for jobtype in self._use_job_types:
-            self.results[jobtype]["EOS"] = {}
-            for eos_name in self.eos_models:
-                try:
-                    eos = EOS(eos_name=eos_name).fit(
-                        self.results[jobtype]["volume"], self.results[jobtype]["energy"]
-                    )
-                    self.results[jobtype]["EOS"][eos_name] = {
-                        **eos.results,
-                        "b0 GPa": float(eos.b0_GPa),
-                    }
-                except EOSError as exc:
-                    self.results[jobtype]["EOS"][eos_name] = {"exception": str(exc)}
+        """Fit the input data to the E(V) EOS models and extract V0."""
+        super().eval()
 
+        jobtype = self._use_job_types[-1]
         for eos_func in self.eos_models:
             if v0 := self.results[jobtype]["EOS"][eos_func].get("v0"):
                 self.results["V0"] = v0
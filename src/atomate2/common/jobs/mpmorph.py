@@ -14,6 +14,7 @@ For information about the current flows, contact:
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
@@ -223,7 +224,16 @@ def _get_chem_env_key_from_composition(
     comp = composition
     if ignore_oxi_states:
         comp = comp.remove_charges()
-    chem_env = "__".join(sorted(set(comp.as_dict())))
+    return _chem_env_key_from_species(tuple(sorted(set(comp.as_dict()))))
+
+
+@lru_cache(maxsize=1024)
+def _chem_env_key_from_species(species: tuple[str, ...]) -> str:
+    """Assemble the chemical environment key from sorted species strings.
+
+    Cached because volume lookups repeatedly hit the same compositions.
+    """
+    chem_env = "__".join(species)
     for char in ["+", "-"]:
         chem_env = chem_env.replace(f"0{char}", "")
     return chem_env
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import re
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 
 import numpy as np
@@ -19,6 +20,57 @@ if TYPE_CHECKING:
 DEFAULT_ATOMIC_MASSES = {el.Z: el.atomic_mass for el in Element}
 
 
+@cache
+def _mol_from_smiles(smiles: str) -> tk.Molecule:
+    """Parse a SMILES string once; RDKit parsing is expensive."""
+    return tk.Molecule.from_smiles(smiles, allow_undefined_stereo=True)
+
+
+@cache
+def _smiles_from_openff_json(openff_mol: str) -> str:
+    """Round-trip a serialized OpenFF molecule to its canonical SMILES."""
+    return tk.Molecule.from_json(openff_mol).to_smiles()
+
+
+@cache
+def _openff_mol_json(smiles: str, charge_scaling: float, charge_method: str) -> str:
+    """Build and serialize a molecule once per unique SMILES and charge setup.
+
+    Charge assignment (e.g. am1bcc via sqm) takes seconds per molecule,
+    so specs that share a SMILES should share the result.
+    """
+    return create_openff_mol(
+        smiles, None, charge_scaling, None, charge_method
+    ).to_json()
+
+
+@cache
+def _atomic_numbers(smiles: str) -> np.ndarray:
+    """Atomic numbers of a molecule as an array, cached per SMILES."""
+    mol = _mol_from_smiles(smiles)
+    return np.fromiter(
+        (atom.atomic_number for atom in mol.atoms), dtype=np.int64, count=mol.n_atoms
+    )
+
+
+_DEFAULT_MASS_TABLE = np.zeros(max(DEFAULT_ATOMIC_MASSES) + 1)
+for _z, _mass in DEFAULT_ATOMIC_MASSES.items():
+    _DEFAULT_MASS_TABLE[_z] = _mass
+
+
+def _mol_weight(smiles: str, atomic_masses: dict[int, float] | None = None) -> float:
+    """Molecular weight of a molecule, vectorized over its atoms.
+
+    Iterating OpenFF atom objects costs a Python attribute access per
+    atom; a single fancy-indexed sum over the cached atomic numbers
+    avoids that for the (default) tabulated masses.
+    """
+    z_vals = _atomic_numbers(smiles)
+    if atomic_masses is None or atomic_masses is DEFAULT_ATOMIC_MASSES:
+        return float(_DEFAULT_MASS_TABLE[z_vals].sum())
+    return sum(atomic_masses[z] for z in z_vals.tolist())
+
+
 def create_mol_spec(
     smiles: str,
     count: int,
@@ -60,13 +112,18 @@ def create_mol_spec(
     if charge_method is None:
         charge_method = "custom" if partial_charges is not None else "am1bcc"
 
-    openff_mol = create_openff_mol(
-        smiles,
-        geometry,
-        charge_scaling,
-        partial_charges,
-        charge_method,
-    )
+    if geometry is None and partial_charges is None:
+        # fully determined by the SMILES string, so the expensive charge
+        # assignment can be shared between specs with the same molecule
+        openff_mol_json = _openff_mol_json(smiles, charge_scaling, charge_method)
+    else:
+        openff_mol_json = create_openff_mol(
+            smiles,
+            geometry,
+            charge_scaling,
+            partial_charges,
+            charge_method,
+        ).to_json()
 
     # create mol_spec
     return MoleculeSpec(
@@ -74,12 +131,18 @@ def create_mol_spec(
         count=count,
         charge_scaling=charge_scaling,
         charge_method=charge_method,
-        openff_mol=openff_mol.to_json(),
+        openff_mol=openff_mol_json,
     )
 
 
+def _create_mol_spec_from_dict(spec_dict: dict) -> MoleculeSpec:
+    """Unpack a kwargs dict for create_mol_spec; must be picklable for pools."""
+    return create_mol_spec(**spec_dict)
+
+
 def create_mol_spec_list(
     input_mol_specs: list[MoleculeSpec | dict],
+    n_workers: int | None = 1,
 ) -> list[MoleculeSpec]:
     """
     Coerce and sort a MoleculeSpecs and dicts to MoleculeSpecs.
@@ -90,17 +153,33 @@ def create_mol_spec_list(
     ----------
     input_mol_specs : list[dict | MoleculeSpec]
         List of dicts or MoleculeSpecs to coerce and sort.
+    n_workers : int or None
+        Number of processes used to create specs from dicts. Charge
+        assignment dominates spec creation and the molecules are
+        independent, so this parallelizes near-linearly. The default of 1
+        keeps everything in-process; None uses one worker per CPU.
 
     Returns
     -------
     List[MoleculeSpec]
         List of MoleculeSpecs sorted by smiles and name.
     """
+    spec_dicts = [spec for spec in input_mol_specs if isinstance(spec, dict)]
+    if n_workers != 1 and len(spec_dicts) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            created = iter(pool.map(_create_mol_spec_from_dict, spec_dicts))
+    else:
+        created = None
+
     mol_specs = []
 
     for spec in input_mol_specs:
         if isinstance(spec, dict):
-            mol_specs.append(create_mol_spec(**spec))
+            mol_specs.append(
+                next(created) if created is not None else create_mol_spec(**spec)
+            )
         elif isinstance(spec, MoleculeSpec):
             mol_specs.append(copy.deepcopy(spec))
         else:
@@ -109,9 +188,7 @@ def create_mol_spec_list(
                 f"must be a list of dicts or MoleculeSpec"
             )
 
-    mol_specs.sort(
-        key=lambda x: tk.Molecule.from_json(x.openff_mol).to_smiles() + x.name
-    )
+    mol_specs.sort(key=lambda x: _smiles_from_openff_json(x.openff_mol) + x.name)
 
     return mol_specs
 
@@ -132,12 +209,15 @@ def merge_specs_by_name_and_smiles(mol_specs: list[MoleculeSpec]) -> list[Molecu
     List[MoleculeSpec]
         A list of merged MoleculeSpecs with unique name and SMILES combinations.
     """
-    mol_specs = copy.deepcopy(mol_specs)
     merged_spec_dict: dict[tuple[str, str], MoleculeSpec] = {}
     for spec in mol_specs:
-        key = (tk.Molecule.from_json(spec.openff_mol).to_smiles(), spec.name)
-        if key in merged_spec_dict:
-            merged_spec_dict[key].count += spec.count
+        key = (_smiles_from_openff_json(spec.openff_mol), spec.name)
+        if (merged := merged_spec_dict.get(key)) is not None:
+            # only the spec whose count changes is copied, and only shallowly;
+            # deep-copying every spec walks the large serialized molecules
+            merged_spec_dict[key] = merged.model_copy(
+                update={"count": merged.count + spec.count}
+            )
         else:
             merged_spec_dict[key] = spec
     return list(merged_spec_dict.values())
@@ -193,11 +273,7 @@ def calculate_elyte_composition(
     }
 
     # Calculate the molecular weights of the solvent
-    atomic_masses = atomic_masses or DEFAULT_ATOMIC_MASSES
-    salt_mws = {}
-    for smile in salts:
-        mol = tk.Molecule.from_smiles(smile, allow_undefined_stereo=True)
-        salt_mws[smile] = sum(atomic_masses[atom.atomic_number] for atom in mol.atoms)
+    salt_mws = {smile: _mol_weight(smile, atomic_masses) for smile in salts}
 
     # Convert salt mole ratios to mass ratios
     salt_mass_ratio = {
@@ -234,12 +310,7 @@ def counts_from_masses(
     numpy.ndarray
         n_mols: Number of each SMILES needed for the given mass ratio.
     """
-    atomic_masses = atomic_masses or DEFAULT_ATOMIC_MASSES
-
-    mol_weights = []
-    for smile in species:
-        mol = tk.Molecule.from_smiles(smile, allow_undefined_stereo=True)
-        mol_weights.append(sum(atomic_masses[atom.atomic_number] for atom in mol.atoms))
+    mol_weights = [_mol_weight(smile, atomic_masses) for smile in species]
 
     mol_ratio = np.array(list(species.values())) / np.array(mol_weights)
     mol_ratio /= sum(mol_ratio)
@@ -274,16 +345,11 @@ def counts_from_box_size(
     dict of str, float
         Number of each species needed to fill the box with the given density.
     """
-    atomic_masses = atomic_masses or DEFAULT_ATOMIC_MASSES
-
     volume = (side_length * 1e-7) ** 3  # Convert from nm3 to cm^3
     total_mass = volume * density  # grams
 
     # Calculate molecular weights
-    mol_weights = []
-    for smile in species:
-        mol = tk.Molecule.from_smiles(smile, allow_undefined_stereo=True)
-        mol_weights.append(sum(atomic_masses[atom.atomic_number] for atom in mol.atoms))
+    mol_weights = [_mol_weight(smile, atomic_masses) for smile in species]
     mean_mw = np.mean(mol_weights)
     n_mol = (total_mass / mean_mw) * Avogadro
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import copy
+import contextlib
 import json
+import os
 import time
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
@@ -21,12 +22,12 @@ from jobflow import Maker, Response, job
 from mdareporter.mdareporter import MDAReporter
 from monty.json import MontyDecoder, MontyEncoder
 from openmm import Integrator, LangevinMiddleIntegrator, Platform, XmlSerializer
-from openmm.app import StateDataReporter
 from openmm.unit import angstrom, kelvin, picoseconds
 from pymatgen.core import Structure
 
 from atomate2.openmm.interchange import OpenMMInterchange
 from atomate2.openmm.utils import (
+    BufferedStateDataReporter,
     PymatgenTrajectoryReporter,
     increment_name,
     task_reports,
@@ -63,7 +64,7 @@ OPENMM_MAKER_DEFAULTS = {
     "step_size": 0.001,
     "temperature": 298,
     "friction_coefficient": 1,
-    "platform_name": "CPU",
+    "platform_name": "auto",
     "platform_properties": {},
     "state_interval": 1000,
     "state_file_name": "state",
@@ -77,6 +78,21 @@ OPENMM_MAKER_DEFAULTS = {
 }
 
 
+def _best_available_platform() -> str:
+    """Return the name of the fastest available OpenMM platform.
+
+    GPU platforms are typically one to two orders of magnitude faster than
+    the CPU platform for non-bonded evaluation, so prefer them when their
+    drivers are present.
+    """
+    for name in ("CUDA", "OpenCL", "CPU"):
+        # openmm raises a bare Exception for unavailable platforms
+        with contextlib.suppress(Exception):
+            Platform.getPlatformByName(name)
+            return name
+    return "Reference"
+
+
 def openmm_job(method: Callable) -> job:
     """Decorate the ``make`` method of ClassicalMD job makers.
 
@@ -143,7 +159,9 @@ class BaseOpenMMMaker(Maker):
         integrator (inverse picoseconds).
     platform_name : Optional[str]
         The name of the OpenMM platform to use, passed to
-        Interchange.to_openmm_simulation.
+        Interchange.to_openmm_simulation. The default, "auto",
+        selects the fastest available platform (CUDA, then OpenCL,
+        then CPU).
     platform_properties : Optional[dict]
         Properties for the OpenMM platform,
         passed to Interchange.to_openmm_simulation.
@@ -157,6 +175,10 @@ class BaseOpenMMMaker(Maker):
         no trajectory, set to 0.
     wrap_traj : Optional[bool]
         Whether to wrap trajectory coordinates.
+    wrap_final_state : Optional[bool]
+        Whether to wrap the coordinates of the final state saved to the
+        interchange. Defaults to the value of ``wrap_traj``; set False to
+        skip the wrapping pass when only the raw coordinates are needed.
     report_velocities : Optional[bool]
         Whether to report velocities in the trajectory file.
     traj_file_name : Optional[str]
@@ -182,6 +204,7 @@ class BaseOpenMMMaker(Maker):
     state_file_name: str | None = field(default=None)
     traj_interval: int | None = field(default=None)
     wrap_traj: bool | None = field(default=None)
+    wrap_final_state: bool | None = field(default=None)
     report_velocities: bool | None = field(default=None)
     traj_file_name: str | None = field(default=None)
     traj_file_type: str | None = field(default=None)
@@ -279,8 +302,14 @@ class BaseOpenMMMaker(Maker):
             except:  # noqa: E722
                 # parse with openmm instead
                 interchange = OpenMMInterchange.model_validate_json(interchange)
-        else:
-            interchange = copy.deepcopy(interchange)
+        # _update_interchange only rebinds positions/velocities/box (or
+        # the serialized state), so a shallow model copy protects the
+        # caller's object without deep-copying the force field and
+        # per-atom arrays
+        elif hasattr(interchange, "model_copy"):
+            interchange = interchange.model_copy()
+        else:  # pydantic v1 Interchange
+            interchange = interchange.copy()
         return interchange
 
     def _add_reporters(
@@ -304,19 +333,40 @@ class BaseOpenMMMaker(Maker):
             The previous task document.
         """
         has_steps = self._resolve_attr("n_steps", prev_task) > 0
+        if not has_steps:
+            # zero-step jobs attach no reporters, so skip trajectory file
+            # resolution and increment checks; still resolve the state
+            # settings EnergyMinimizationMaker's one-shot report reads
+            for attr in ("state_interval", "state_file_name", "wrap_traj"):
+                self._resolve_attr(attr, prev_task)
+            return
         # add trajectory reporter
         traj_interval = self._resolve_attr("traj_interval", prev_task)
+        state_interval = self._resolve_attr("state_interval", prev_task)
+        if any(0 < i < 10 for i in (traj_interval, state_interval)):
+            warnings.warn(
+                "Reporting intervals below 10 steps force a state download "
+                "on nearly every step, which can dominate the simulation "
+                "time on GPU platforms. Consider a larger traj_interval / "
+                "state_interval.",
+                stacklevel=2,
+            )
         traj_file_name = self._resolve_attr("traj_file_name", prev_task)
         traj_file_type = self._resolve_attr("traj_file_type", prev_task)
         report_velocities = self._resolve_attr("report_velocities", prev_task)
         wrap_traj = self._resolve_attr("wrap_traj", prev_task)
 
-        if has_steps & (traj_interval > 0):
+        if traj_interval > 0:
             writer_kwargs = {}
             # these are the only file types that support velocities
             if traj_file_type in ("h5md", "nc", "ncdf", "json"):
                 writer_kwargs["velocities"] = report_velocities
                 writer_kwargs["forces"] = False
+            if traj_file_type == "h5md":
+                # light gzip on chunked HDF5 frames cuts disk bandwidth
+                # several-fold and is transparent to readers
+                writer_kwargs["compression"] = "gzip"
+                writer_kwargs["compression_opts"] = 1
 
             traj_file = dir_name / f"{traj_file_name}.{traj_file_type}"
 
@@ -356,14 +406,13 @@ class BaseOpenMMMaker(Maker):
             sim.reporters.append(traj_reporter)
 
         # add state reporter
-        state_interval = self._resolve_attr("state_interval", prev_task)
         state_file_name = self._resolve_attr("state_file_name", prev_task)
-        if has_steps & (state_interval > 0):
+        if state_interval > 0:
             state_file = dir_name / f"{state_file_name}.csv"
             if state_file.exists() and task_reports(prev_task, "state"):
                 self.state_file_name = increment_name(state_file_name)
 
-            state_reporter = StateDataReporter(
+            state_reporter = BufferedStateDataReporter(
                 file=f"{dir_name / self.state_file_name}.csv",
                 reportInterval=state_interval,
                 step=True,
@@ -426,22 +475,21 @@ class BaseOpenMMMaker(Maker):
         Any
             The resolved attribute value.
         """
-        prev_task = prev_task or OpenMMTaskDocument()
-
         # retrieve previous CalculationInput through multiple Optional fields
-        if prev_task.calcs_reversed:
+        if prev_task and prev_task.calcs_reversed:
             prev_input = prev_task.calcs_reversed[0].input
         else:
             prev_input = None
 
-        defaults = OPENMM_MAKER_DEFAULTS | (add_defaults or {})
-
         if getattr(self, attr, None) is not None:
+            # also hit on repeat calls, since resolved values are set on self
             attr_value = getattr(self, attr)
         elif getattr(prev_input, attr, None) is not None:
             attr_value = getattr(prev_input, attr)
         else:
-            attr_value = defaults.get(attr)
+            # merge defaults lazily; most calls resolve from self or the
+            # previous task and never need the dict
+            attr_value = (OPENMM_MAKER_DEFAULTS | (add_defaults or {})).get(attr)
 
         setattr(self, attr, attr_value)
         return getattr(self, attr)
@@ -494,10 +542,20 @@ class BaseOpenMMMaker(Maker):
             The created OpenMM simulation object.
         """
         integrator = self._create_integrator(prev_task)
-        platform = Platform.getPlatformByName(
-            self._resolve_attr("platform_name", prev_task)
-        )
+        platform_name = self._resolve_attr("platform_name", prev_task)
+        auto_selected = platform_name == "auto"
+        if auto_selected:
+            platform_name = _best_available_platform()
+        platform = Platform.getPlatformByName(platform_name)
         platform_properties = self._resolve_attr("platform_properties", prev_task)
+        if auto_selected and not platform_properties and platform_name == "CUDA":
+            # mixed precision is as accurate as double for MD integration
+            # but runs at near single-precision speed on most GPUs
+            platform_properties = {"Precision": "mixed"}
+        if platform_name == "CPU" and "Threads" not in (platform_properties or {}):
+            # the CPU platform does not always saturate the machine by default
+            platform_properties = dict(platform_properties or {})
+            platform_properties["Threads"] = str(os.cpu_count())
 
         return interchange.to_openmm_simulation(
             integrator,
@@ -525,10 +583,19 @@ class BaseOpenMMMaker(Maker):
         prev_task : Optional[OpenMMTaskDocument]
             The previous task document.
         """
+        # wrapping is a CPU-side pass over all positions (and a device sync
+        # on GPU platforms), so only pay for it when requested
+        wrap_state = self._resolve_attr(
+            "wrap_final_state",
+            prev_task,
+            add_defaults={
+                "wrap_final_state": self._resolve_attr("wrap_traj", prev_task)
+            },
+        )
         state = sim.context.getState(
             getPositions=True,
             getVelocities=True,
-            enforcePeriodicBox=self._resolve_attr("wrap_traj", prev_task),
+            enforcePeriodicBox=wrap_state,
         )
         if isinstance(interchange, Interchange):
             interchange.positions = state.getPositions(asNumpy=True)
@@ -600,9 +667,15 @@ class BaseOpenMMMaker(Maker):
         OpenMMTaskDocument
             The created task document.
         """
-        maker_attrs = copy.deepcopy(dict(vars(self)))
-        job_name = maker_attrs.pop("name")
-        tags = maker_attrs.pop("tags")
+        # CalculationInput validation copies the values it keeps,
+        # so no defensive deepcopy of the maker fields is needed
+        maker_attrs = {
+            attr.name: getattr(self, attr.name)
+            for attr in fields(self)
+            if attr.name not in ("name", "tags")
+        }
+        job_name = self.name
+        tags = self.tags
         state_file_name = self._resolve_attr("state_file_name", prev_task)
         traj_file_name = self._resolve_attr("traj_file_name", prev_task)
         traj_file_type = self._resolve_attr("traj_file_type", prev_task)
@@ -217,9 +217,12 @@ class TempChangeMaker(BaseOpenMMMaker):
         """
         integrator = sim.context.getIntegrator()
 
+        # skip the starting temperature (the integrator is already there)
+        # so the last gradation lands exactly on the target temperature,
+        # including when temp_steps == 1
         temps = np.linspace(
-            self.starting_temperature, self.temperature, self.temp_steps
-        )
+            self.starting_temperature, self.temperature, self.temp_steps + 1
+        )[1:]
         steps = create_list_summing_to(self.n_steps, self.temp_steps)
         for temp, n_steps in zip(temps, steps, strict=True):
             integrator.setTemperature(temp * kelvin)
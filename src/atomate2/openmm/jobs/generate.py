@@ -42,6 +42,24 @@ except ImportError as e:
     ) from e
 
 
+_PTABLE_BY_SYMBOL = {el.symbol: el.number for el in Element}
+
+_SYMBOL_RE = re.compile(r"^[A-Za-z]+")
+
+# (xpath, attribute-name stub) pairs whose type names LigParGen reuses
+# across files and which therefore need incrementing
+_TYPE_ATTR_XPATHS = (
+    (".//AtomTypes/Type", "name"),
+    (".//AtomTypes/Type", "class"),
+    (".//Residues/Residue/Atom", "type"),
+    (".//HarmonicBondForce/Bond", "class"),
+    (".//HarmonicAngleForce/Angle", "class"),
+    (".//PeriodicTorsionForce/Proper", "class"),
+    (".//PeriodicTorsionForce/Improper", "class"),
+    (".//NonbondedForce/Atom", "type"),
+)
+
+
 class XMLMoleculeFF:
     """A class for manipulating XML files representing OpenMM-compatible forcefields."""
 
@@ -57,8 +75,12 @@ class XMLMoleculeFF:
         for i, atom in enumerate(root.findall(".//Residues/Residue/Atom")):
             canonical_order[atom.attrib["type"]] = i
 
+        # cached for the partial_charges property; increment_types only
+        # renames attributes, so the element list stays valid
+        self._nb_atoms = root.findall(".//NonbondedForce/Atom")
+
         non_to_res_map = {}
-        for i, atom in enumerate(root.findall(".//NonbondedForce/Atom")):
+        for i, atom in enumerate(self._nb_atoms):
             non_to_res_map[i] = canonical_order[atom.attrib["type"]]
             # self._res_to_non.append(canonical_order[atom.attrib["type"]])
         # invert map, change to list
@@ -78,17 +100,7 @@ class XMLMoleculeFF:
         in XML files, then causing an error in OpenMM. We differentiate
         the types with this method.
         """
-        root_type = [
-            (".//AtomTypes/Type", "name"),
-            (".//AtomTypes/Type", "class"),
-            (".//Residues/Residue/Atom", "type"),
-            (".//HarmonicBondForce/Bond", "class"),
-            (".//HarmonicAngleForce/Angle", "class"),
-            (".//PeriodicTorsionForce/Proper", "class"),
-            (".//PeriodicTorsionForce/Improper", "class"),
-            (".//NonbondedForce/Atom", "type"),
-        ]
-        for xpath, type_stub in root_type:
+        for xpath, type_stub in _TYPE_ATTR_XPATHS:
             for element in self.tree.getroot().findall(xpath):
                 for key in element.attrib:
                     if type_stub in key:
@@ -100,11 +112,10 @@ class XMLMoleculeFF:
             # TODO: update message
             warnings.warn("Formal charges not considered.", stacklevel=1)
 
-        p_table = {e.symbol: e.number for e in Element}
         openff_mol = tk.Molecule()
         for atom in self.tree.getroot().findall(".//Residues/Residue/Atom"):
-            symbol = re.match(r"^[A-Za-z]+", atom.attrib["name"]).group()
-            atomic_number = p_table[symbol]
+            symbol = _SYMBOL_RE.match(atom.attrib["name"]).group()
+            atomic_number = _PTABLE_BY_SYMBOL[symbol]
             openff_mol.add_atom(atomic_number, formal_charge=0, is_aromatic=False)
 
         for bond in self.tree.getroot().findall(".//Residues/Residue/Bond"):
@@ -122,13 +133,16 @@ class XMLMoleculeFF:
     @property
     def partial_charges(self) -> np.ndarray:
         """Get the partial charges from the XMLMoleculeFF object."""
-        atoms = self.tree.getroot().findall(".//NonbondedForce/Atom")
-        charges = np.array([float(atom.attrib["charge"]) for atom in atoms])
+        charges = np.fromiter(
+            (float(atom.attrib["charge"]) for atom in self._nb_atoms),
+            dtype=np.float64,
+            count=len(self._nb_atoms),
+        )
         return charges[self._res_to_non]
 
     @partial_charges.setter
     def partial_charges(self, partial_charges: np.ndarray) -> None:
-        for i, atom in enumerate(self.tree.getroot().findall(".//NonbondedForce/Atom")):
+        for i, atom in enumerate(self._nb_atoms):
             charge = partial_charges[self._non_to_res[i]]
             atom.attrib["charge"] = str(charge)
 
@@ -142,12 +156,15 @@ class XMLMoleculeFF:
             If a string is provided, openff_toolkit.Molecule.assign_partial_charges
             will be used to generate the partial charges.
         """
-        if isinstance(mol_or_method, str):
-            openff_mol = self.to_openff_molecule()
-            openff_mol.assign_partial_charges(mol_or_method)
-            mol_or_method = openff_mol
         self_mol = self.to_openff_molecule()
-        _isomorphic, atom_map = get_atom_map(mol_or_method, self_mol)
+        if isinstance(mol_or_method, str):
+            # charges are generated on this molecule itself, so the atom
+            # map is the identity and the isomorphism search can be skipped
+            self_mol.assign_partial_charges(mol_or_method)
+            mol_or_method = self_mol
+            atom_map = {i: i for i in range(self_mol.n_atoms)}
+        else:
+            _isomorphic, atom_map = get_atom_map(mol_or_method, self_mol)
         mol_charges = mol_or_method.partial_charges[list(atom_map.values())].magnitude
         self.partial_charges = mol_charges
 
@@ -169,7 +186,9 @@ def create_ff_from_xml(
     """Create OpenMM forcefield from a list of molecule specifications and XML files."""
     io_files = []
     for i, xml in enumerate(xml_mols):
-        xml_copy = copy.deepcopy(xml)
+        # re-parsing through the C expat parser is faster than a Python
+        # deepcopy of the ElementTree and leaves the input untouched
+        xml_copy = XMLMoleculeFF(str(xml))
         xml_copy.increment_types(f"_{i}")
         io_files.append(io.StringIO(str(xml_copy)))
 
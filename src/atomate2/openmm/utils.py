@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import io
 import os
-import re
 import shutil
 import tempfile
 import time
@@ -22,7 +21,7 @@ from openmm import (
     System,
     XmlSerializer,
 )
-from openmm.app import PDBFile, Simulation
+from openmm.app import PDBFile, Simulation, StateDataReporter
 from pymatgen.core.trajectory import Trajectory
 
 from atomate2.openmm.interchange import OpenMMInterchange
@@ -32,6 +31,15 @@ if TYPE_CHECKING:
     from openff.interchange import Interchange
 
 
+def _completed_downloads(download_dir: str | Path) -> list[Path]:
+    """List downloaded files, ignoring in-progress browser temp files."""
+    return [
+        path
+        for path in Path(download_dir).iterdir()
+        if path.suffix not in (".crdownload", ".tmp")
+    ]
+
+
 def download_opls_xml(
     names_params: dict[str, dict[str, str]],
     output_dir: str | Path,
@@ -53,30 +61,29 @@ def download_opls_xml(
             stacklevel=1,
         )
 
-    # Initialize the Chrome driver
-    driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()))
-
-    for name, params in names_params.items():
-        final_file = Path(output_dir) / f"{name}.xml"
-        smiles = params.get("smiles")
-        charge = params.get("charge", 0)
-        checkopt = params.get("checkopt", 3)
-
-        if final_file.exists() and not overwrite_files:
-            continue
-        try:
-            # Specify the directory where you want to download files
-            with tempfile.TemporaryDirectory() as tmpdir:
-                download_dir = tmpdir
-
-                # Set up Chrome options
-                chrome_options = webdriver.ChromeOptions()
-                prefs = {"download.default_directory": download_dir}
-                chrome_options.add_experimental_option("prefs", prefs)
+    # a single browser session and download directory are reused for every
+    # molecule; Chrome startup dominates the per-molecule cost otherwise
+    with tempfile.TemporaryDirectory() as download_dir:
+        # Set up Chrome options
+        chrome_options = webdriver.ChromeOptions()
+        prefs = {"download.default_directory": download_dir}
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        # Initialize the Chrome driver
+        driver = webdriver.Chrome(
+            service=ChromeService(ChromeDriverManager().install()),
+            options=chrome_options,
+        )
 
-                # Initialize Chrome with the options
-                driver = webdriver.Chrome(options=chrome_options)
+        for name, params in names_params.items():
+            final_file = Path(output_dir) / f"{name}.xml"
+            smiles = params.get("smiles")
+            charge = params.get("charge", 0)
+            checkopt = params.get("checkopt", 3)
 
+            if final_file.exists() and not overwrite_files:
+                continue
+            try:
                 # Open the first webpage
                 driver.get("https://zarbi.chem.yale.edu/ligpargen/")
 
@@ -116,21 +123,29 @@ def download_opls_xml(
                 )
                 xml_button.click()
 
-                # Wait for the file to download
-                time.sleep(0.3)  # Adjust as needed based on the download time
-
-                file = next(Path(tmpdir).iterdir())
+                # Wait for the download to finish rather than sleeping a
+                # fixed interval; Chrome stages the transfer as a
+                # .crdownload file, so only a completed file may match
+                WebDriverWait(driver, 30).until(
+                    lambda _: _completed_downloads(download_dir)
+                )
+                file = _completed_downloads(download_dir)[0]
 
                 # copy downloaded file to output_file using os
                 shutil.move(file, final_file)
 
-        except Exception as e:  # noqa: BLE001
-            warnings.warn(
-                f"{name} ({smiles}) failed to download because an error occurred: {e}",
-                stacklevel=1,
-            )
+            except Exception as e:  # noqa: BLE001
+                warnings.warn(
+                    f"{name} ({smiles}) failed to download "
+                    f"because an error occurred: {e}",
+                    stacklevel=1,
+                )
+                # leave the shared download directory empty for the next
+                # molecule
+                for stale in Path(download_dir).iterdir():
+                    stale.unlink()
 
-    driver.quit()
+        driver.quit()
 
 
 def generate_opls_xml(
@@ -205,7 +220,7 @@ def generate_opls_xml(
             )
 
 
-def create_list_summing_to(total_sum: int, n_pieces: int) -> list:
+def create_list_summing_to(total_sum: int, n_pieces: int) -> np.ndarray:
     """Create a NumPy array with n_pieces elements that sum up to total_sum.
 
     Divides total_sum by n_pieces to determine the base value for each element.
@@ -223,17 +238,20 @@ def create_list_summing_to(total_sum: int, n_pieces: int) -> list:
     numpy.ndarray
         A 1D NumPy array with n_pieces elements summing up to total_sum.
     """
-    div, mod = total_sum // n_pieces, total_sum % n_pieces
-    return [div + 1] * mod + [div] * (n_pieces - mod)
+    div, mod = divmod(total_sum, n_pieces)
+    pieces = np.full(n_pieces, div, dtype=np.int64)
+    pieces[:mod] += 1
+    return pieces
 
 
 def increment_name(file_name: str) -> str:
     """Increment the count in a file name."""
-    # logic to increment count on file name
-    re_match = re.search(r"(\d*)$", file_name)
-    position = re_match.start(1)
-    new_count = int(re_match.group(1) or 1) + 1
-    return f"{file_name[:position]}{new_count}"
+    # scan back over any trailing digits; cheaper than a regex match
+    i = len(file_name)
+    while i > 0 and file_name[i - 1].isdigit():
+        i -= 1
+    new_count = int(file_name[i:] or 1) + 1
+    return f"{file_name[:i]}{new_count}"
 
 
 def task_reports(task: OpenMMTaskDocument, traj_or_state: str = "traj") -> bool:
@@ -336,6 +354,60 @@ def opls_lj(system: System) -> System:
     return system
 
 
+class _DeferredFlushFile:
+    """File proxy whose ``flush`` is a no-op.
+
+    StateDataReporter flushes its output after every report, which defeats
+    any write buffering on the underlying handle. Routing the output
+    through this proxy keeps rows in the buffer until the file is closed.
+    """
+
+    def __init__(self, handle: io.TextIOBase) -> None:
+        self._handle = handle
+
+    def write(self, data: str) -> int:
+        """Write to the buffered handle."""
+        return self._handle.write(data)
+
+    def flush(self) -> None:
+        """Do nothing; the buffer is flushed when the file is closed."""
+
+    def close(self) -> None:
+        """Close (and thereby flush) the buffered handle."""
+        self._handle.close()
+
+
+class BufferedStateDataReporter(StateDataReporter):
+    """StateDataReporter that batches CSV rows in a write buffer.
+
+    The parent class flushes after every report, so each row costs a
+    write() syscall no matter how the file was opened. Writing through
+    a no-op-flush proxy lets long simulations accumulate rows in a 1 MiB
+    buffer instead. The buffer is flushed when the reporter is deleted
+    and closes the file, which BaseOpenMMMaker does before the state
+    file is read back into the task document.
+    """
+
+    def __init__(self, file: str | Path, reportInterval: int, **kwargs) -> None:  # noqa: N803
+        # the handle lives as long as the reporter; StateDataReporter
+        # closes it on deletion because _openedFile is set below
+        buffered = open(file, "w", buffering=1 << 20)  # noqa: SIM115
+        super().__init__(_DeferredFlushFile(buffered), reportInterval, **kwargs)
+        self._openedFile = True
+
+    def save(self) -> None:
+        """Flush buffered rows to disk by closing the file.
+
+        BaseOpenMMMaker calls this when it detaches reporters, before the
+        state file is parsed into the task document; relying on garbage
+        collection to close the file would leave that read racing the
+        reporter's deletion.
+        """
+        if self._openedFile:
+            self._out.close()
+            self._openedFile = False
+
+
 class PymatgenTrajectoryReporter:
     """Reporter that creates a pymatgen Trajectory from an OpenMM simulation.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -337,6 +338,20 @@ def _clear_vasp_inputs() -> None:
     logger.info("Cleared vasp inputs")
 
 
+def _stage_output_file(output_file: Path, dest_dir: Path) -> None:
+    """Hard-link a reference output into place, copying if linking fails.
+
+    Jobs only ever read, gzip, or unlink the staged outputs, so sharing
+    the underlying data with the reference tree is safe and avoids
+    re-copying the same files for every mocked run.
+    """
+    try:
+        os.link(output_file, dest_dir / output_file.name)
+    except OSError:
+        # cross-device link or a filesystem without hard-link support
+        shutil.copy(output_file, dest_dir)
+
+
 def _copy_vasp_outputs(ref_path: Path) -> None:
     """Copy VASP output files from the reference directory."""
     output_path = ref_path / "outputs"
@@ -344,13 +359,13 @@ def _copy_vasp_outputs(ref_path: Path) -> None:
 
     for output_file in output_path.iterdir():
         if output_file.is_file():
-            shutil.copy(output_file, ".")
+            _stage_output_file(output_file, Path())
 
     for idx, neb_dir in enumerate(neb_dirs):
         (copied_neb_dir := Path(f"./{idx:02}")).mkdir(parents=True, exist_ok=True)
         for output_file in neb_dir.iterdir():
             if output_file.is_file():
-                shutil.copy(output_file, copied_neb_dir)
+                _stage_output_file(output_file, copied_neb_dir)
 
 
 class TestData(BaseModel):
@@ -46,8 +46,11 @@ def test_npt_init_kwargs(si_structure, clean_dir, caplog):
         )
         # The run_ase is necessary for correct class instantiation
         npt_berend_str.run_ase(si_structure)
-        assert "pressure_au" in npt_berend_str.ase_md_kwargs
-        assert "externalstress" not in npt_berend_str.ase_md_kwargs
+        md_kwargs = npt_berend_str._get_ensemble_defaults()  # noqa: SLF001
+        assert "pressure_au" in md_kwargs
+        assert "externalstress" not in md_kwargs
+        # resolving defaults must not leak into the maker's own kwargs
+        assert "pressure_au" not in npt_berend_str.ase_md_kwargs
 
     for dyn in ("nose-hoover-chain", MTKNPT):
         npt_mtk_str = LennardJonesMDMaker(
@@ -60,8 +63,9 @@ def test_npt_init_kwargs(si_structure, clean_dir, caplog):
         )
         # The run_ase is necessary for correct class instantiation
         npt_mtk_str.run_ase(si_structure)
-        assert "pressure_au" in npt_mtk_str.ase_md_kwargs
-        assert "externalstress" not in npt_mtk_str.ase_md_kwargs
+        md_kwargs = npt_mtk_str._get_ensemble_defaults()  # noqa: SLF001
+        assert "pressure_au" in md_kwargs
+        assert "externalstress" not in md_kwargs
 
     caplog.set_level(logging.WARNING)
     for dyn in ("nose-hoover", NPT):
@@ -69,8 +73,9 @@ def test_npt_init_kwargs(si_structure, clean_dir, caplog):
             ensemble="npt", dynamics=dyn, temperature=300, pressure=1.0, n_steps=1
         )
         npt_nh_str.run_ase(si_structure)
-        assert "externalstress" in npt_nh_str.ase_md_kwargs
-        assert "pressure_au" not in npt_nh_str.ase_md_kwargs
+        md_kwargs = npt_nh_str._get_ensemble_defaults()  # noqa: SLF001
+        assert "externalstress" in md_kwargs
+        assert "pressure_au" not in md_kwargs
         assert "The `NPT` module in ASE is no longer recommended" in caplog.text
 
 
@@ -107,6 +112,29 @@ def test_ase_nvt_maker(calculator_name, lj_fcc_ne_pars, fcc_ne_structure, clean_
     assert output.structure.volume == pytest.approx(structure.volume)
 
 
+def test_ase_md_replicas(lj_fcc_ne_pars, fcc_ne_structure, clean_dir):
+    structure = fcc_ne_structure * (2, 2, 2)
+
+    md_job = LennardJonesMDMaker(
+        calculator_kwargs=lj_fcc_ne_pars,
+        mb_velocity_seed=_mb_velocity_seed,
+        temperature=1000,
+        ensemble="nvt",
+        n_steps=10,
+        n_replicas=2,
+    ).make(structure)
+
+    responses = run_locally(md_job)
+    task_docs = [
+        resp[max(resp)].output
+        for resp in responses.values()
+        if isinstance(resp[max(resp)].output, AseStructureTaskDoc)
+    ]
+    assert len(task_docs) == 2
+    for task_doc in task_docs:
+        assert task_doc.structure.volume == pytest.approx(structure.volume)
+
+
 @pytest.mark.parametrize("calculator_name", ["LJ"])
 def test_ase_npt_maker(calculator_name, lj_fcc_ne_pars, fcc_ne_structure, tmp_dir):
     os.environ["OMP_NUM_THREADS"] = "1"
@@ -2,6 +2,7 @@
 
 from shutil import which
 
+import numpy as np
 import pytest
 from jobflow import run_locally
 from pandas import DataFrame
@@ -26,54 +27,49 @@ def mock_avg_vol_db(test_dir):
     )
 
 
+@pytest.fixture(scope="module")
+def avg_vols_df(mock_avg_vol_db):
+    # parse the reference file once per module, not once per parametrization
+    return _get_average_volumes_file()
+
+
 def test_get_ref_file(mock_avg_vol_db):
     assert isinstance(_get_average_volumes_file(), DataFrame)
 
 
 @pytest.mark.parametrize(
-    "db, ignore_oxi_states", [("icsd", [True, False]), ("mp", [True])]
+    "db, ignore_oxi", [("icsd", True), ("icsd", False), ("mp", True)]
 )
-def test_get_average_volume_from_icsd(
-    db: str, ignore_oxi_states: list[bool], mock_avg_vol_db
-):
+def test_get_average_volume_from_icsd(db: str, ignore_oxi: bool, avg_vols_df):
     comp = Composition({"Ag+": 1, "Cl5+": 1, "O2-": 3})
 
-    avg_vols = _get_average_volumes_file()
-    avg_vols = avg_vols[avg_vols["source"] == db]
+    avg_vols = avg_vols_df[avg_vols_df["source"] == db]
+    chem_env_arr = avg_vols["chem_env"].to_numpy()
+    with_oxi_arr = avg_vols["with_oxi"].to_numpy()
 
-    kwargs = {}
     if db == "icsd":
         ref_vols = {0: 14.204405661000004, 1: 14.244954961061925}
         get_avg_vol_func = get_average_volume_from_db_cached
         args = (db,)
+        kwargs = {"ignore_oxi_states": ignore_oxi}
     elif db == "mp":
         ref_vols = {1: 17.845894151307604}
         get_avg_vol_func = get_average_volume_from_mp
         args = tuple()
+        kwargs = {}
     else:
         raise ValueError(f"Unknown database {db}")
 
-    for ignore_oxi in ignore_oxi_states:
-        chem_env = "Ag__Cl__O" if ignore_oxi else "Ag+__Cl5+__O2-"
-
-        kwargs = {"ignore_oxi_states": ignore_oxi} if db == "icsd" else {}
-        assert (
-            _get_chem_env_key_from_composition(comp, ignore_oxi_states=ignore_oxi)
-            == chem_env
-        )
-        assert (
-            len(
-                avg_vols[
-                    (avg_vols["chem_env"] == chem_env)
-                    & (~avg_vols["with_oxi"] if ignore_oxi else avg_vols["with_oxi"])
-                ]
-            )
-            > 0
-        )
-
-        assert get_avg_vol_func(comp, *args, **kwargs) == pytest.approx(
-            ref_vols[ignore_oxi]
-        )
+    chem_env = "Ag__Cl__O" if ignore_oxi else "Ag+__Cl5+__O2-"
+    assert (
+        _get_chem_env_key_from_composition(comp, ignore_oxi_states=ignore_oxi)
+        == chem_env
+    )
+    assert np.any((chem_env_arr == chem_env) & (with_oxi_arr ^ ignore_oxi))
+
+    assert get_avg_vol_func(comp, *args, **kwargs) == pytest.approx(
+        ref_vols[ignore_oxi]
+    )
 
     comp = Composition({"Ag+": 1, "Cu2+": 1, "Cl-": 3})
     if db == "icsd":
@@ -81,23 +77,21 @@ def test_get_average_volume_from_icsd(
     elif db == "mp":
         ref_vols = {1: 21.972236147327344}
 
-    for ignore_oxi in ignore_oxi_states:
-        chem_env = "Ag__Cl__Cu" if ignore_oxi else "Ag+__Cl-__Cu2+"
-        kwargs = {"ignore_oxi_states": ignore_oxi} if db == "icsd" else {}
-        assert (
-            _get_chem_env_key_from_composition(comp, ignore_oxi_states=ignore_oxi)
-            == chem_env
-        )
-        assert get_avg_vol_func(comp, *args, **kwargs) == pytest.approx(
-            ref_vols[ignore_oxi]
-        )
+    chem_env = "Ag__Cl__Cu" if ignore_oxi else "Ag+__Cl-__Cu2+"
+    assert (
+        _get_chem_env_key_from_composition(comp, ignore_oxi_states=ignore_oxi)
+        == chem_env
+    )
+    assert get_avg_vol_func(comp, *args, **kwargs) == pytest.approx(
+        ref_vols[ignore_oxi]
+    )
 
     # test value error on missing data for elements
     with pytest.raises(ValueError, match="No unary"):
         get_avg_vol_func(Composition({"Og2+": 1}), *args, **kwargs)
 
     # test that there's a fallback for when the only available data is unary
-    assert len(avg_vols[avg_vols["chem_env"] == "Ag__Os"]) == 0
+    assert not np.any(chem_env_arr == "Ag__Os")
     assert get_avg_vol_func(Composition("Ag Os"), *args, **kwargs) == pytest.approx(
         15.299831934654062 if db == "icsd" else 21.993489561622383
     )
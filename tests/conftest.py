@@ -97,16 +97,27 @@ def log_to_stdout_auto_use():
     initialize_logger()
 
 
-@pytest.fixture
-def si_structure(test_dir):
+@pytest.fixture(scope="session")
+def _si_structure_parsed(test_dir):
+    # parse the CIF once per session; tests get fresh copies below
     return Structure.from_file(test_dir / "structures" / "Si.cif")
 
 
 @pytest.fixture
-def si_diamond(test_dir):
+def si_structure(_si_structure_parsed):
+    return _si_structure_parsed.copy()
+
+
+@pytest.fixture(scope="session")
+def _si_diamond_parsed(test_dir):
     return Structure.from_file(test_dir / "structures" / "Si_diamond.cif")
 
 
+@pytest.fixture
+def si_diamond(_si_diamond_parsed):
+    return _si_diamond_parsed.copy()
+
+
 @pytest.fixture
 def al2_au_structure(test_dir):
     return Structure.from_file(test_dir / "structures" / "Al2Au.cif")
@@ -1,7 +1,9 @@
+import json
 from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
+import pytest
 from emmet.core.openmm import OpenMMTaskDocument
 from monty.serialization import loadfn
 from openmm import XmlSerializer
@@ -15,35 +17,45 @@ from atomate2.openmm.jobs import (
 )
 
 
+@pytest.fixture(scope="module")
+def start_state(interchange: OpenMMInterchange):
+    # the package-scoped interchange never changes, so deserialize its
+    # state once for all the did-the-positions-move assertions below
+    return XmlSerializer.deserialize(interchange.state)
+
+
+def _final_state(task_doc):
+    # pull the state XML out of the serialized interchange directly;
+    # full OpenMMInterchange validation is covered elsewhere
+    return XmlSerializer.deserialize(json.loads(task_doc.interchange)["state"])
+
+
 def test_energy_minimization_maker(
-    interchange: OpenMMInterchange, run_job: Callable
+    interchange: OpenMMInterchange, start_state, run_job: Callable
 ) -> None:
-    state = XmlSerializer.deserialize(interchange.state)
-    start_positions = state.getPositions(asNumpy=True)
+    start_positions = start_state.getPositions(asNumpy=True)
 
     maker = EnergyMinimizationMaker(max_iterations=1)
     base_job = maker.make(interchange)
     task_doc = run_job(base_job)
 
-    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
-    new_state = XmlSerializer.deserialize(new_interchange.state)
-    new_positions = new_state.getPositions(asNumpy=True)
+    new_positions = _final_state(task_doc).getPositions(asNumpy=True)
 
     assert not np.all(new_positions == start_positions)
     assert (Path(task_doc.calcs_reversed[0].output.dir_name) / "state.csv").exists()
 
 
-def test_npt_maker(interchange: OpenMMInterchange, run_job: Callable) -> None:
-    state = XmlSerializer.deserialize(interchange.state)
-    start_positions = state.getPositions(asNumpy=True)
-    start_box = state.getPeriodicBoxVectors()
+def test_npt_maker(
+    interchange: OpenMMInterchange, start_state, run_job: Callable
+) -> None:
+    start_positions = start_state.getPositions(asNumpy=True)
+    start_box = start_state.getPeriodicBoxVectors()
 
     maker = NPTMaker(n_steps=10, pressure=0.1, pressure_update_frequency=1)
     base_job = maker.make(interchange)
     task_doc = run_job(base_job)
 
-    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
-    new_state = XmlSerializer.deserialize(new_interchange.state)
+    new_state = _final_state(task_doc)
     new_positions = new_state.getPositions(asNumpy=True)
     new_box = new_state.getPeriodicBoxVectors()
 
@@ -52,17 +64,16 @@ def test_npt_maker(interchange: OpenMMInterchange, run_job: Callable) -> None:
     assert not np.all(new_box == start_box)
 
 
-def test_nvt_maker(interchange: OpenMMInterchange, run_job: Callable) -> None:
-    state = XmlSerializer.deserialize(interchange.state)
-    start_positions = state.getPositions(asNumpy=True)
+def test_nvt_maker(
+    interchange: OpenMMInterchange, start_state, run_job: Callable
+) -> None:
+    start_positions = start_state.getPositions(asNumpy=True)
 
     maker = NVTMaker(n_steps=10, state_interval=1, traj_interval=5)
     base_job = maker.make(interchange)
     task_doc = run_job(base_job)
 
-    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
-    new_state = XmlSerializer.deserialize(new_interchange.state)
-    new_positions = new_state.getPositions(asNumpy=True)
+    new_positions = _final_state(task_doc).getPositions(asNumpy=True)
 
     # test that coordinates have changed
     assert not np.all(new_positions == start_positions)
@@ -75,17 +86,16 @@ def test_nvt_maker(interchange: OpenMMInterchange, run_job: Callable) -> None:
     assert calc_output.steps_reported == list(range(1, 11))
 
 
-def test_temp_change_maker(interchange: OpenMMInterchange, run_job: Callable):
-    state = XmlSerializer.deserialize(interchange.state)
-    start_positions = state.getPositions(asNumpy=True)
+def test_temp_change_maker(
+    interchange: OpenMMInterchange, start_state, run_job: Callable
+):
+    start_positions = start_state.getPositions(asNumpy=True)
 
     maker = TempChangeMaker(n_steps=10, temperature=310, temp_steps=10)
     base_job = maker.make(interchange)
     task_doc = run_job(base_job)
 
-    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
-    new_state = XmlSerializer.deserialize(new_interchange.state)
-    new_positions = new_state.getPositions(asNumpy=True)
+    new_positions = _final_state(task_doc).getPositions(asNumpy=True)
 
     # test that coordinates have changed
     assert not np.all(new_positions == start_positions)